@@ -2,65 +2,124 @@
 
 import asyncio
 import argparse
-import json
+import shlex
+import sys
+import orjson
+from contextvars import ContextVar
 from datetime import datetime, timedelta
-from services.ecourts_scraper import ECourtsScraper
-from services.database import Database
+from typing import TYPE_CHECKING, List, Optional
+
+if TYPE_CHECKING:
+    from services.ecourts_scraper import ECourtsScraper
+    from services.database import Database
+
+_scraper = None
+_db = None
+
+# Set inside a --batch job so its output is written as one block when it finishes
+_job_output: ContextVar[Optional[List[str]]] = ContextVar("_job_output", default=None)
+
+def get_scraper() -> "ECourtsScraper":
+    """Return the scraper shared by all CLI commands"""
+    global _scraper
+    if _scraper is None:
+        from services.ecourts_scraper import ECourtsScraper
+        _scraper = ECourtsScraper()
+    return _scraper
+
+def get_db() -> "Database":
+    """Return the database client shared by all CLI commands"""
+    global _db
+    if _db is None:
+        from services.database import Database
+        _db = Database()
+    return _db
+
+def _ts(dt=None) -> str:
+    """Format a datetime as YYYYMMDD_HHMMSS for output filenames"""
+    dt = dt or datetime.now()
+    return f"{dt.year:04d}{dt.month:02d}{dt.day:02d}_{dt.hour:02d}{dt.minute:02d}{dt.second:02d}"
+
+def _date(dt=None) -> str:
+    """Format a datetime as DD-MM-YYYY"""
+    dt = dt or datetime.now()
+    return f"{dt.day:02d}-{dt.month:02d}-{dt.year:04d}"
+
+def emit(text: str):
+    """Write text to stdout, or to the running batch job's buffer"""
+    buffer = _job_output.get()
+    if buffer is None:
+        sys.stdout.write(text)
+    else:
+        buffer.append(text)
 
 def print_json(data):
     """Pretty print JSON data"""
-    print(json.dumps(data, indent=2, ensure_ascii=False))
+    payload = orjson.dumps(
+        data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE
+    )
+    if _job_output.get() is None:
+        sys.stdout.flush()
+        sys.stdout.buffer.write(payload)
+    else:
+        emit(payload.decode())
+
+def write_lines(lines):
+    """Write a block of output lines with a single call"""
+    emit("\n".join(lines) + "\n")
+
+def case_summary_lines(result):
+    """Build the human-readable summary shown after a case search"""
+    if not result.get("found"):
+        return ["\nCase not found or not listed today/tomorrow"]
+
+    lines = ["\n" + "=" * 50, "CASE FOUND!"]
+    if result.get("listed_today"):
+        lines.append("Listed: TODAY")
+    elif result.get("listed_tomorrow"):
+        lines.append("Listed: TOMORROW")
+
+    if result.get("serial_number"):
+        lines.append(f"Serial Number: {result['serial_number']}")
+    if result.get("court_name"):
+        lines.append(f"Court: {result['court_name']}")
+    lines.append("=" * 50)
+    return lines
 
 def save_to_file(data, filename):
     """Save data to JSON file"""
-    with open(filename, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
-    print(f"\nData saved to: {filename}")
+    with open(filename, 'wb') as f:
+        f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    emit(f"\nData saved to: {filename}\n")
 
 async def search_cnr(cnr: str, state_code: str = None, district_code: str = None):
     """Search case by CNR number"""
-    scraper = ECourtsScraper()
-    db = Database()
+    scraper = get_scraper()
+    db = get_db()
 
-    print(f"\nSearching for CNR: {cnr}")
-    print("=" * 50)
+    write_lines([f"\nSearching for CNR: {cnr}", "=" * 50])
 
     result = await scraper.search_case_by_cnr(cnr, state_code, district_code)
 
     if result:
         print_json(result)
 
-        if result.get("found"):
-            print("\n" + "=" * 50)
-            print("CASE FOUND!")
-            if result.get("listed_today"):
-                print("Listed: TODAY")
-            elif result.get("listed_tomorrow"):
-                print("Listed: TOMORROW")
-
-            if result.get("serial_number"):
-                print(f"Serial Number: {result['serial_number']}")
-            if result.get("court_name"):
-                print(f"Court: {result['court_name']}")
-            print("=" * 50)
-        else:
-            print("\nCase not found or not listed today/tomorrow")
+        write_lines(case_summary_lines(result))
 
         await db.save_search_result(result)
 
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = _ts()
         save_to_file(result, f"case_search_{cnr}_{timestamp}.json")
     else:
-        print("Error: Unable to fetch case details")
+        emit("Error: Unable to fetch case details\n")
 
 async def search_case(state_code: str, district_code: str, court_code: str,
                      case_type: str, case_number: str, case_year: str):
     """Search case by case details"""
-    scraper = ECourtsScraper()
-    db = Database()
+    scraper = get_scraper()
+    db = get_db()
 
-    print(f"\nSearching for Case: {case_type}/{case_number}/{case_year}")
-    print("=" * 50)
+    write_lines([f"\nSearching for Case: {case_type}/{case_number}/{case_year}", "=" * 50])
 
     result = await scraper.search_case_by_details(
         state_code, district_code, court_code,
@@ -70,42 +129,27 @@ async def search_case(state_code: str, district_code: str, court_code: str,
     if result:
         print_json(result)
 
-        if result.get("found"):
-            print("\n" + "=" * 50)
-            print("CASE FOUND!")
-            if result.get("listed_today"):
-                print("Listed: TODAY")
-            elif result.get("listed_tomorrow"):
-                print("Listed: TOMORROW")
-
-            if result.get("serial_number"):
-                print(f"Serial Number: {result['serial_number']}")
-            if result.get("court_name"):
-                print(f"Court: {result['court_name']}")
-            print("=" * 50)
-        else:
-            print("\nCase not found or not listed today/tomorrow")
+        write_lines(case_summary_lines(result))
 
         await db.save_search_result(result)
 
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = _ts()
         case_id = f"{case_type}_{case_number}_{case_year}"
         save_to_file(result, f"case_search_{case_id}_{timestamp}.json")
     else:
-        print("Error: Unable to fetch case details")
+        emit("Error: Unable to fetch case details\n")
 
 async def fetch_cause_list(state_code: str, district_code: str,
                           court_complex_code: str, court_code: str = None,
                           date: str = None, download_pdf: bool = False):
     """Fetch cause list for a court"""
-    scraper = ECourtsScraper()
-    db = Database()
+    scraper = get_scraper()
+    db = get_db()
 
     if not date:
-        date = datetime.now().strftime("%d-%m-%Y")
+        date = _date()
 
-    print(f"\nFetching cause list for date: {date}")
-    print("=" * 50)
+    write_lines([f"\nFetching cause list for date: {date}", "=" * 50])
 
     cause_list = await scraper.fetch_cause_list(
         state_code, district_code, court_complex_code, court_code, date
@@ -114,59 +158,73 @@ async def fetch_cause_list(state_code: str, district_code: str,
     if cause_list:
         print_json(cause_list)
 
-        print(f"\nTotal cases: {cause_list.get('total_cases', 0)}")
+        emit(f"\nTotal cases: {cause_list.get('total_cases', 0)}\n")
 
         await db.save_cause_list(cause_list)
 
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = _ts()
         filename = f"cause_list_{state_code}_{district_code}_{date.replace('-', '')}_{timestamp}.json"
         save_to_file(cause_list, filename)
 
         if download_pdf:
-            print("\nDownloading PDF...")
+            emit("\nDownloading PDF...\n")
             pdf_path = await scraper.download_cause_list_pdf(
                 state_code, district_code, court_complex_code, court_code, date
             )
             if pdf_path:
-                print(f"PDF downloaded: {pdf_path}")
+                emit(f"PDF downloaded: {pdf_path}\n")
             else:
-                print("Error: Unable to download PDF")
+                emit("Error: Unable to download PDF\n")
     else:
-        print("Error: Unable to fetch cause list")
+        emit("Error: Unable to fetch cause list\n")
 
 async def list_states():
     """List all available states"""
-    scraper = ECourtsScraper()
-    print("\nFetching states...")
-    print("=" * 50)
+    scraper = get_scraper()
+    write_lines(["\nFetching states...", "=" * 50])
 
     states = await scraper.fetch_states()
     if states:
-        print(f"\nTotal states: {len(states)}\n")
-        for state in states:
-            print(f"{state['code']}: {state['name']}")
+        write_lines([f"\nTotal states: {len(states)}\n"] + [
+            f"{state['code']}: {state['name']}" for state in states
+        ])
     else:
-        print("Error: Unable to fetch states")
+        emit("Error: Unable to fetch states\n")
 
 async def list_districts(state_code: str):
     """List all districts for a state"""
-    scraper = ECourtsScraper()
-    print(f"\nFetching districts for state code: {state_code}")
-    print("=" * 50)
+    scraper = get_scraper()
+    write_lines([f"\nFetching districts for state code: {state_code}", "=" * 50])
 
     districts = await scraper.fetch_districts(state_code)
     if districts:
-        print(f"\nTotal districts: {len(districts)}\n")
-        for district in districts:
-            print(f"{district['code']}: {district['name']}")
+        write_lines([f"\nTotal districts: {len(districts)}\n"] + [
+            f"{district['code']}: {district['name']}" for district in districts
+        ])
     else:
-        print("Error: Unable to fetch districts")
+        emit("Error: Unable to fetch districts\n")
+
+async def run_causelist(args):
+    """Resolve --today/--tomorrow and fetch the cause list"""
+    date = args.date
+    if args.today:
+        date = _date()
+    elif args.tomorrow:
+        date = _date(datetime.now() + timedelta(days=1))
+
+    await fetch_cause_list(
+        args.state, args.district, args.complex, args.court,
+        date, args.pdf
+    )
 
-async def main():
+def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="eCourts Scraper CLI - Fetch case details and cause lists from Indian eCourts",
         formatter_class=argparse.RawDescriptionHelpFormatter
     )
+    parser.add_argument("--batch", metavar="FILE", help="Run one command per line from FILE concurrently")
+    parser.add_argument("--concurrency", type=int, metavar="N",
+                        help="Maximum batch commands running at once (default: scraper request limit)")
 
     subparsers = parser.add_subparsers(dest="command", help="Available commands")
 
@@ -174,6 +232,7 @@ async def main():
     search_cnr_parser.add_argument("cnr", help="CNR number")
     search_cnr_parser.add_argument("--state", help="State code (optional)")
     search_cnr_parser.add_argument("--district", help="District code (optional)")
+    search_cnr_parser.set_defaults(func=lambda args: search_cnr(args.cnr, args.state, args.district))
 
     search_case_parser = subparsers.add_parser("search-case", help="Search case by details")
     search_case_parser.add_argument("--state", required=True, help="State code")
@@ -182,6 +241,10 @@ async def main():
     search_case_parser.add_argument("--type", required=True, help="Case type")
     search_case_parser.add_argument("--number", required=True, help="Case number")
     search_case_parser.add_argument("--year", required=True, help="Case year")
+    search_case_parser.set_defaults(func=lambda args: search_case(
+        args.state, args.district, args.court,
+        args.type, args.number, args.year
+    ))
 
     causelist_parser = subparsers.add_parser("causelist", help="Fetch cause list")
     causelist_parser.add_argument("--state", required=True, help="State code")
@@ -192,43 +255,73 @@ async def main():
     causelist_parser.add_argument("--today", action="store_true", help="Fetch today's cause list")
     causelist_parser.add_argument("--tomorrow", action="store_true", help="Fetch tomorrow's cause list")
     causelist_parser.add_argument("--pdf", action="store_true", help="Download PDF")
+    causelist_parser.set_defaults(func=run_causelist)
 
     states_parser = subparsers.add_parser("states", help="List all states")
+    states_parser.set_defaults(func=lambda args: list_states())
 
     districts_parser = subparsers.add_parser("districts", help="List districts for a state")
     districts_parser.add_argument("state_code", help="State code")
+    districts_parser.set_defaults(func=lambda args: list_districts(args.state_code))
+
+    return parser
+
+async def run_batch(parser: argparse.ArgumentParser, path: str, concurrency: Optional[int] = None):
+    """Run every command listed in a batch file on one event loop"""
+    jobs = []
+    try:
+        with open(path, encoding='utf-8') as f:
+            for line_no, line in enumerate(f, 1):
+                line = line.strip()
+                if not line or line.startswith("#"):
+                    continue
+                try:
+                    args = parser.parse_args(shlex.split(line))
+                except (SystemExit, ValueError):
+                    print(f"Skipping line {line_no}: invalid command '{line}'")
+                    continue
+                if not hasattr(args, "func"):
+                    print(f"Skipping line {line_no}: no command given in '{line}'")
+                    continue
+                jobs.append((line, args))
+    except (OSError, UnicodeDecodeError) as exc:
+        print(f"Error: unable to read batch file '{path}': {exc}")
+        return
+
+    if concurrency is None:
+        from services.ecourts_scraper import MAX_CONCURRENT_REQUESTS
+        concurrency = MAX_CONCURRENT_REQUESTS
+    semaphore = asyncio.Semaphore(max(concurrency, 1))
+
+    async def run_job(line: str, args: argparse.Namespace):
+        async with semaphore:
+            buffer: List[str] = []
+            _job_output.set(buffer)
+            try:
+                await args.func(args)
+            except Exception as exc:
+                buffer.append(f"Error running '{line}': {exc}\n")
+            finally:
+                sys.stdout.write("".join(buffer))
+                sys.stdout.flush()
+
+    await asyncio.gather(*(run_job(line, args) for line, args in jobs))
 
+async def main():
+    parser = build_parser()
     args = parser.parse_args()
 
-    if args.command == "search-cnr":
-        await search_cnr(args.cnr, args.state, args.district)
-
-    elif args.command == "search-case":
-        await search_case(
-            args.state, args.district, args.court,
-            args.type, args.number, args.year
-        )
-
-    elif args.command == "causelist":
-        date = args.date
-        if args.today:
-            date = datetime.now().strftime("%d-%m-%Y")
-        elif args.tomorrow:
-            date = (datetime.now() + timedelta(days=1)).strftime("%d-%m-%Y")
-
-        await fetch_cause_list(
-            args.state, args.district, args.complex, args.court,
-            date, args.pdf
-        )
-
-    elif args.command == "states":
-        await list_states()
-
-    elif args.command == "districts":
-        await list_districts(args.state_code)
-
-    else:
-        parser.print_help()
+    try:
+        if args.batch:
+            await run_batch(parser, args.batch, args.concurrency)
+        elif hasattr(args, "func"):
+            await args.func(args)
+        else:
+            parser.print_help()
+    finally:
+        if _scraper is not None:
+            from services.ecourts_scraper import close_shared_client
+            await close_shared_client()
 
 if __name__ == "__main__":
     asyncio.run(main())
@@ -1,15 +1,33 @@
 from fastapi import FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi.responses import FileResponse, ORJSONResponse, Response
 from pydantic import BaseModel
-from typing import Optional, List
+from typing import Optional, List, Dict, Tuple, Any, AsyncIterator
 import os
+import time
+import orjson
+from contextlib import asynccontextmanager
 from datetime import datetime, timedelta
 
-from services.ecourts_scraper import ECourtsScraper
+from services.ecourts_scraper import ECourtsScraper, get_shared_client, close_shared_client, warm_up
 from services.database import Database
 
-app = FastAPI(title="eCourts Scraper API", version="1.0.0")
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Open the shared eCourts HTTP client on startup and close it on shutdown"""
+    warm_up()
+    get_shared_client()
+    try:
+        yield
+    finally:
+        await close_shared_client()
+
+app = FastAPI(
+    title="eCourts Scraper API",
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
+)
 
 app.add_middleware(
     CORSMiddleware,
@@ -22,6 +40,21 @@ app.add_middleware(
 scraper = ECourtsScraper()
 db = Database()
 
+# Reference data (states, districts, complexes, courts) changes on the order
+# of months, so repeat lookups are served from memory for a day.
+REFERENCE_CACHE_TTL = 24 * 60 * 60
+_reference_cache: Dict[Tuple[str, ...], Tuple[float, Any]] = {}
+
+def _get_cached_reference(key: Tuple[str, ...]) -> Optional[Any]:
+    entry = _reference_cache.get(key)
+    if entry and entry[0] > time.monotonic():
+        return entry[1]
+    return None
+
+def _set_cached_reference(key: Tuple[str, ...], value: Any) -> None:
+    if value:
+        _reference_cache[key] = (time.monotonic() + REFERENCE_CACHE_TTL, value)
+
 class CaseSearchByCNR(BaseModel):
     cnr: str
     state_code: Optional[str] = None
@@ -45,28 +78,41 @@ class CauseListRequest(BaseModel):
     captcha_code: str
     date: str
 
+_ROOT_BODY = orjson.dumps({
+    "message": "eCourts Scraper API",
+    "version": "1.0.0",
+    "endpoints": {
+        "states": "/api/states",
+        "districts": "/api/districts/{state_code}",
+        "court_complexes": "/api/court-complexes/{state_code}/{district_code}",
+        "courts": "/api/courts/{state_code}/{district_code}/{complex_code}",
+        "search_cnr": "/api/search/cnr",
+        "search_case": "/api/search/case",
+        "cause_list": "/api/cause-list",
+        "download_pdf": "/api/download/pdf"
+    }
+})
+
+_HEALTH_PREFIX = b'{"status":"healthy","timestamp":"'
+_HEALTH_SUFFIX = b'"}'
+
 @app.get("/")
 async def root():
-    return {
-        "message": "eCourts Scraper API",
-        "version": "1.0.0",
-        "endpoints": {
-            "states": "/api/states",
-            "districts": "/api/districts/{state_code}",
-            "court_complexes": "/api/court-complexes/{state_code}/{district_code}",
-            "courts": "/api/courts/{state_code}/{district_code}/{complex_code}",
-            "search_cnr": "/api/search/cnr",
-            "search_case": "/api/search/case",
-            "cause_list": "/api/cause-list",
-            "download_pdf": "/api/download/pdf"
-        }
-    }
+    return Response(content=_ROOT_BODY, media_type="application/json")
 
 @app.get("/api/states")
 async def get_states():
     try:
-        states = await scraper.fetch_states()
-        await db.cache_states(states)
+        states = _get_cached_reference(("states",))
+        if states is None:
+            states = await db.get_cached_states(max_age=REFERENCE_CACHE_TTL)
+            if not states:
+                states = await scraper.fetch_states()
+                if scraper.is_default_states(states):
+                    # Serve the built-in list but keep retrying the scrape
+                    return {"success": True, "data": states}
+                await db.cache_states(states)
+            _set_cached_reference(("states",), states)
         return {"success": True, "data": states}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -74,8 +120,12 @@ async def get_states():
 @app.get("/api/districts/{state_code}")
 async def get_districts(state_code: str):
     try:
-        districts = await scraper.fetch_districts(state_code)
-        await db.cache_districts(state_code, districts)
+        key = ("districts", state_code)
+        districts = _get_cached_reference(key)
+        if districts is None:
+            districts = await scraper.fetch_districts(state_code)
+            await db.cache_districts(state_code, districts)
+            _set_cached_reference(key, districts)
         return {"success": True, "data": districts}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -83,8 +133,12 @@ async def get_districts(state_code: str):
 @app.get("/api/court-complexes/{state_code}/{district_code}")
 async def get_court_complexes(state_code: str, district_code: str):
     try:
-        complexes = await scraper.fetch_court_complexes(state_code, district_code)
-        await db.cache_court_complexes(state_code, district_code, complexes)
+        key = ("court_complexes", state_code, district_code)
+        complexes = _get_cached_reference(key)
+        if complexes is None:
+            complexes = await scraper.fetch_court_complexes(state_code, district_code)
+            await db.cache_court_complexes(state_code, district_code, complexes)
+            _set_cached_reference(key, complexes)
         return {"success": True, "data": complexes}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -92,8 +146,12 @@ async def get_court_complexes(state_code: str, district_code: str):
 @app.get("/api/courts/{state_code}/{district_code}/{complex_code}")
 async def get_courts(state_code: str, district_code: str, complex_code: str):
     try:
-        courts = await scraper.fetch_courts(state_code, district_code, complex_code)
-        await db.cache_courts(state_code, district_code, complex_code, courts)
+        key = ("courts", state_code, district_code, complex_code)
+        courts = _get_cached_reference(key)
+        if courts is None:
+            courts = await scraper.fetch_courts(state_code, district_code, complex_code)
+            await db.cache_courts(state_code, district_code, complex_code, courts)
+            _set_cached_reference(key, courts)
         return {"success": True, "data": courts}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -150,7 +208,7 @@ async def get_cause_list(request: CauseListRequest):
         if cause_list and cause_list.get("cases"):
             await db.save_cause_list(cause_list)
 
-        return {"success": True, "data": cause_list}
+        return ORJSONResponse(content={"success": True, "data": cause_list}, media_type="application/json")
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -196,11 +254,21 @@ async def download_pdf(
 
 @app.get("/api/health")
 async def health_check():
-    return {
-        "status": "healthy",
-        "timestamp": datetime.now().isoformat()
-    }
+    timestamp = datetime.now().isoformat().encode()
+    return Response(content=_HEALTH_PREFIX + timestamp + _HEALTH_SUFFIX, media_type="application/json")
 
 if __name__ == "__main__":
+    import sys
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # The cause-list captcha is tied to the eCourts session (cookies and
+    # app_token) held by one process, so extra workers need sticky routing.
+    workers = int(os.getenv("WEB_CONCURRENCY", "1"))
+    uvicorn.run(
+        # Workers must import the app themselves; a single process reuses this module
+        "main:app" if workers > 1 else app,
+        host="0.0.0.0",
+        port=8000,
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        workers=workers
+    )
@@ -1,32 +1,81 @@
-from supabase import create_client, Client
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, TYPE_CHECKING
 import os
-from datetime import datetime
-import json
+import asyncio
+from datetime import datetime, timedelta
+import httpx
+
+if TYPE_CHECKING:
+    from supabase import Client
+
+WRITE_BATCH_SIZE = 500
+
+_postgrest_session: Optional[httpx.Client] = None
+
+def _get_postgrest_session(template: httpx.Client) -> httpx.Client:
+    """Return the keep-alive HTTP/2 session shared by every Database instance"""
+    global _postgrest_session
+    if _postgrest_session is None:
+        # postgrest-py closes its session via aclose(), which SyncClient adds to httpx.Client
+        from postgrest.utils import SyncClient
+        _postgrest_session = SyncClient(
+            base_url=template.base_url,
+            headers=template.headers,
+            timeout=template.timeout,
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=20)
+        )
+    return _postgrest_session
 
 class Database:
     def __init__(self):
         supabase_url = os.getenv("SUPABASE_URL", "")
         supabase_key = os.getenv("SUPABASE_SERVICE_ROLE_KEY", "")
 
+        self.client: Optional["Client"]
         if supabase_url and supabase_key:
-            self.client: Client = create_client(supabase_url, supabase_key)
+            from supabase import create_client
+            self.client = create_client(supabase_url, supabase_key)
+            postgrest = self.client.postgrest
+            default_session = postgrest.session
+            postgrest.session = _get_postgrest_session(default_session)
+            if default_session is not postgrest.session:
+                default_session.close()
         else:
             self.client = None
             print("Warning: Supabase credentials not found. Database features disabled.")
 
+    async def _execute(self, query):
+        """Run a blocking Supabase query in a worker thread"""
+        return await asyncio.to_thread(query.execute)
+
+    async def _upsert_rows(self, table: str, rows: List[Dict[str, str]], on_conflict: str) -> None:
+        """Upsert rows in batches, one request per batch"""
+        # A batch may not touch the same conflict key twice, so keep the last row per key
+        key_columns = on_conflict.split(",")
+        rows = list({tuple(row[column] for column in key_columns): row for row in rows}.values())
+        for start in range(0, len(rows), WRITE_BATCH_SIZE):
+            batch = rows[start:start + WRITE_BATCH_SIZE]
+            await self._execute(self.client.table(table).upsert(batch, on_conflict=on_conflict))
+
+    async def _insert_rows(self, table: str, rows: List[Dict]) -> None:
+        """Insert rows in batches, one request per batch"""
+        for start in range(0, len(rows), WRITE_BATCH_SIZE):
+            batch = rows[start:start + WRITE_BATCH_SIZE]
+            await self._execute(self.client.table(table).insert(batch))
+
     async def cache_states(self, states: List[Dict[str, str]]) -> bool:
         """Cache states in database"""
         if not self.client:
             return False
 
         try:
-            for state in states:
-                self.client.table("states").upsert({
-                    "code": state["code"],
-                    "name": state["name"],
-                    "updated_at": datetime.now().isoformat()
-                }, on_conflict="code").execute()
+            updated_at = datetime.now().isoformat()
+            rows = [{
+                "code": state["code"],
+                "name": state["name"],
+                "updated_at": updated_at
+            } for state in states]
+            await self._upsert_rows("states", rows, on_conflict="code")
             return True
         except Exception as e:
             print(f"Error caching states: {e}")
@@ -38,13 +87,14 @@ class Database:
             return False
 
         try:
-            for district in districts:
-                self.client.table("districts").upsert({
-                    "state_code": state_code,
-                    "code": district["code"],
-                    "name": district["name"],
-                    "updated_at": datetime.now().isoformat()
-                }, on_conflict="state_code,code").execute()
+            updated_at = datetime.now().isoformat()
+            rows = [{
+                "state_code": state_code,
+                "code": district["code"],
+                "name": district["name"],
+                "updated_at": updated_at
+            } for district in districts]
+            await self._upsert_rows("districts", rows, on_conflict="state_code,code")
             return True
         except Exception as e:
             print(f"Error caching districts: {e}")
@@ -56,14 +106,15 @@ class Database:
             return False
 
         try:
-            for complex in complexes:
-                self.client.table("court_complexes").upsert({
-                    "state_code": state_code,
-                    "district_code": district_code,
-                    "code": complex["code"],
-                    "name": complex["name"],
-                    "updated_at": datetime.now().isoformat()
-                }, on_conflict="state_code,district_code,code").execute()
+            updated_at = datetime.now().isoformat()
+            rows = [{
+                "state_code": state_code,
+                "district_code": district_code,
+                "code": complex["code"],
+                "name": complex["name"],
+                "updated_at": updated_at
+            } for complex in complexes]
+            await self._upsert_rows("court_complexes", rows, on_conflict="state_code,district_code,code")
             return True
         except Exception as e:
             print(f"Error caching court complexes: {e}")
@@ -75,15 +126,16 @@ class Database:
             return False
 
         try:
-            for court in courts:
-                self.client.table("courts").upsert({
-                    "state_code": state_code,
-                    "district_code": district_code,
-                    "complex_code": complex_code,
-                    "code": court["code"],
-                    "name": court["name"],
-                    "updated_at": datetime.now().isoformat()
-                }, on_conflict="state_code,district_code,complex_code,code").execute()
+            updated_at = datetime.now().isoformat()
+            rows = [{
+                "state_code": state_code,
+                "district_code": district_code,
+                "complex_code": complex_code,
+                "code": court["code"],
+                "name": court["name"],
+                "updated_at": updated_at
+            } for court in courts]
+            await self._upsert_rows("courts", rows, on_conflict="state_code,district_code,complex_code,code")
             return True
         except Exception as e:
             print(f"Error caching courts: {e}")
@@ -95,11 +147,10 @@ class Database:
             return False
 
         try:
-            self.client.table("search_results").insert({
+            await self._execute(self.client.table("search_results").insert({
                 "case_id": result.get("case_id"),
                 "search_type": result.get("search_type"),
                 "cnr": result.get("cnr"),
-                "case_details": json.dumps(result.get("case_details", {})),
                 "found": result.get("found", False),
                 "listed_today": result.get("listed_today", False),
                 "listed_tomorrow": result.get("listed_tomorrow", False),
@@ -107,9 +158,9 @@ class Database:
                 "court_name": result.get("court_name"),
                 "next_hearing_date": result.get("next_hearing_date"),
                 "case_status": result.get("case_status"),
-                "full_result": json.dumps(result),
+                "full_result": result,
                 "searched_at": datetime.now().isoformat()
-            }).execute()
+            }))
             return True
         except Exception as e:
             print(f"Error saving search result: {e}")
@@ -122,29 +173,46 @@ class Database:
 
         try:
             metadata = cause_list.get("metadata", {})
-            self.client.table("cause_lists").insert({
+            response = await self._execute(self.client.table("cause_lists").insert({
                 "state_code": metadata.get("state_code"),
                 "district_code": metadata.get("district_code"),
                 "court_complex_code": metadata.get("court_complex_code"),
                 "court_code": metadata.get("court_code"),
                 "date": metadata.get("date"),
                 "total_cases": cause_list.get("total_cases", 0),
-                "cases": json.dumps(cause_list.get("cases", [])),
-                "full_data": json.dumps(cause_list),
-                "fetched_at": metadata.get("fetched_at", datetime.now().isoformat())
-            }).execute()
+                "fetched_at": metadata.get("fetched_at") or datetime.now().isoformat()
+            }))
+            cause_list_id = response.data[0]["id"]
+            try:
+                await self._insert_rows("cause_list_cases", [{
+                    "cause_list_id": cause_list_id,
+                    "position": position,
+                    "serial_number": case.get("serial_number"),
+                    "case_number": case.get("case_number"),
+                    "parties": case.get("parties"),
+                    "advocate": case.get("advocate"),
+                    "purpose": case.get("purpose")
+                } for position, case in enumerate(cause_list.get("cases", []))])
+            except Exception:
+                # Don't leave a parent row claiming cases it doesn't have
+                await self._execute(self.client.table("cause_lists").delete().eq("id", cause_list_id))
+                raise
             return True
         except Exception as e:
             print(f"Error saving cause list: {e}")
             return False
 
-    async def get_cached_states(self) -> Optional[List[Dict[str, str]]]:
-        """Get cached states from database"""
+    async def get_cached_states(self, max_age: Optional[float] = None) -> Optional[List[Dict[str, str]]]:
+        """Get cached states from database, ignoring rows older than max_age seconds"""
         if not self.client:
             return None
 
         try:
-            response = self.client.table("states").select("*").execute()
+            query = self.client.table("states").select("*").order("name")
+            if max_age is not None:
+                cutoff = datetime.now() - timedelta(seconds=max_age)
+                query = query.gte("updated_at", cutoff.isoformat())
+            response = await self._execute(query)
             return [{"code": row["code"], "name": row["name"]} for row in response.data]
         except Exception as e:
             print(f"Error getting cached states: {e}")
@@ -1,36 +1,196 @@
 import base64
-from bs4 import BeautifulSoup
-from typing import List, Dict, Optional, Any
-import json
-from datetime import datetime, timedelta
+import html
+from lxml import etree
+from typing import List, Dict, Optional, Any, Tuple, Callable, Awaitable, Sequence
+import orjson
+from datetime import date, datetime, timedelta
 import asyncio
+from functools import lru_cache
+from itertools import islice
 import httpx
+import aiofiles
 import os
+import re
+import time
 from urllib.parse import urljoin
 
+# Upper bound on concurrent requests to a single eCourts host
+MAX_CONCURRENT_REQUESTS = 8
+
+# Attempts per request and backoff (seconds) between them for transport errors
+REQUEST_ATTEMPTS = 4
+RETRY_BACKOFF_BASE = 0.2
+RETRY_BACKOFF_MAX = 2.0
+
+# A read timeout already cost a full client timeout, so give up sooner on those
+READ_TIMEOUT_ATTEMPTS = 2
+
+# Transient network and timeout failures; protocol/configuration errors are not retried
+_RETRYABLE_ERRORS = (httpx.NetworkError, httpx.TimeoutException)
+
+# Failures that happen before a request reaches the server, so even
+# non-idempotent requests (captcha issue/submit) can be safely resent
+_PRE_SEND_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+# How long fetched dropdown data (states, districts, complexes, courts) is reused
+DROPDOWN_CACHE_TTL = 60 * 60
+
+# Bytes read from the network per write when saving cause list PDFs
+PDF_CHUNK_SIZE = 64 * 1024
+
+# "<complex id>@<comma separated establishment codes>@<flag>", later parts optional
+_COMPLEX_RE = re.compile(r'([^@]*)(?:@([^@]*)(?:@([^@]*))?)?')
+
+@lru_cache(maxsize=None)
+def _html_parser(encoding: str) -> etree.HTMLParser:
+    return etree.HTMLParser(encoding=encoding)
+
+_NON_WHITESPACE = re.compile(rb'\S')
+
+# Dropdown options that carry a real value (not blank and not the "0" placeholder)
+_OPTION_XPATH = etree.XPath('.//option[normalize-space(@value) != "" and normalize-space(@value) != "0"]')
+
+# Court number options, skipping blanks, the "D" divider and the "Select Court" prompt
+_COURT_OPTION_XPATH = etree.XPath(
+    './/option[normalize-space(@value) != ""'
+    ' and translate(normalize-space(@value), "d", "D") != "D"'
+    ' and not(contains(., "Select Court"))]'
+)
+
+_OPTION_RE = re.compile(r'<option[^>]*\svalue="([^"]*)"[^>]*>([^<]*)</option>', re.I)
+_OPTION_TAG_RE = re.compile(r'<option\b', re.I)
+
+def _is_selectable_option(value: str, text: str) -> bool:
+    return value not in ("", "0")
+
+def _is_court_option(value: str, text: str) -> bool:
+    return bool(value) and value.upper() != "D" and "Select Court" not in text
+
+_CAPTCHA_AUDIO_XPATH = etree.XPath(
+    './/a[contains(concat(" ", normalize-space(@class), " "), " captcha_play_button ")]'
+)
+
+_STATE_SELECT_PATHS = (
+    './/select[@id="sess_state_code"]',
+    './/select[@id="state_code"]',
+    './/select[@name="state_code"]',
+)
+
+# Every row of the first table in a cause list fragment, header row included
+_CAUSE_LIST_ROWS = etree.XPath('(//table)[1]//tr')
+
+_DEFAULT_STATES: Tuple[Dict[str, str], ...] = (
+    {"code": "28", "name": "Andaman and Nicobar"},
+    {"code": "2", "name": "Andhra Pradesh"},
+    {"code": "36", "name": "Arunachal Pradesh"},
+    {"code": "6", "name": "Assam"},
+    {"code": "8", "name": "Bihar"},
+    {"code": "27", "name": "Chandigarh"},
+    {"code": "18", "name": "Chhattisgarh"},
+    {"code": "26", "name": "Delhi"},
+    {"code": "30", "name": "Goa"},
+    {"code": "17", "name": "Gujarat"},
+    {"code": "14", "name": "Haryana"},
+    {"code": "5", "name": "Himachal Pradesh"},
+    {"code": "12", "name": "Jammu and Kashmir"},
+    {"code": "7", "name": "Jharkhand"},
+    {"code": "3", "name": "Karnataka"},
+    {"code": "4", "name": "Kerala"},
+    {"code": "33", "name": "Ladakh"},
+    {"code": "37", "name": "Lakshadweep"},
+    {"code": "23", "name": "Madhya Pradesh"},
+    {"code": "1", "name": "Maharashtra"},
+    {"code": "25", "name": "Manipur"},
+    {"code": "21", "name": "Meghalaya"},
+    {"code": "19", "name": "Mizoram"},
+    {"code": "34", "name": "Nagaland"},
+    {"code": "11", "name": "Odisha"},
+    {"code": "35", "name": "Puducherry"},
+    {"code": "22", "name": "Punjab"},
+    {"code": "9", "name": "Rajasthan"},
+    {"code": "24", "name": "Sikkim"},
+    {"code": "10", "name": "Tamil Nadu"},
+    {"code": "29", "name": "Telangana"},
+    {"code": "38", "name": "The Dadra And Nagar Haveli And Daman And Diu"},
+    {"code": "20", "name": "Tripura"},
+    {"code": "15", "name": "Uttarakhand"},
+    {"code": "13", "name": "Uttar Pradesh"},
+    {"code": "16", "name": "West Bengal"}
+)
+
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+    "Accept": "application/json, text/javascript, */*; q=0.01",
+    "Accept-Language": "en-US,en;q=0.9",
+    "X-Requested-With": "XMLHttpRequest",
+    "Origin": "https://services.ecourts.gov.in",
+    "Referer": "https://services.ecourts.gov.in/ecourtindia_v6/?p=cause_list/",
+    "Content-Type": "application/x-www-form-urlencoded; charset=UTF-8"
+}
+
+_shared_client: Optional[httpx.AsyncClient] = None
+
+def get_shared_client() -> httpx.AsyncClient:
+    """Return the keep-alive client shared by every scraper instance"""
+    global _shared_client
+    if _shared_client is None or _shared_client.is_closed:
+        _shared_client = httpx.AsyncClient(
+            headers=DEFAULT_HEADERS,
+            timeout=30.0,
+            transport=httpx.AsyncHTTPTransport(
+                http2=True,
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+                retries=1
+            )
+        )
+    return _shared_client
+
+async def close_shared_client() -> None:
+    """Close the shared client and its connection pool"""
+    global _shared_client
+    if _shared_client is not None:
+        await _shared_client.aclose()
+        _shared_client = None
+
+def warm_up() -> None:
+    """Create the cached HTML parser before the first request needs it"""
+    _html_parser("utf-8")
+
+_DATE_FMT = "%d-%m-%Y"
+
+def _parse_dmy_date(value: str) -> Optional[date]:
+    """Parse a DD-MM-YYYY string, returning None if it is not a valid date"""
+    try:
+        if len(value) == 10 and value[2] == '-' and value[5] == '-':
+            return date(int(value[6:10]), int(value[3:5]), int(value[0:2]))
+        return datetime.strptime(value, _DATE_FMT).date()
+    except ValueError:
+        return None
+
 class ECourtsScraper:
     def __init__(self):
         self.base_url = "https://services.ecourts.gov.in/ecourtindia_v6"
         self.alternative_url = "https://newdelhi.dcourts.gov.in"
-        self.session = None
+        # Bound to the shared client on first use, so constructing a scraper does no I/O setup
+        self.session: Optional[httpx.AsyncClient] = None
         self.session_initialized = False
         self._init_path = "/?p=cause_list/"
         self.app_token: Optional[str] = None
-        self.headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-            "Accept": "application/json, text/javascript, */*; q=0.01",
-            "Accept-Language": "en-US,en;q=0.9",
-            "X-Requested-With": "XMLHttpRequest",
-            "Origin": "https://services.ecourts.gov.in",
-            "Referer": "https://services.ecourts.gov.in/ecourtindia_v6/?p=cause_list/",
-            "Content-Type": "application/x-www-form-urlencoded; charset=UTF-8"
-        }
+        self._base_form: Dict[str, str] = {"ajax_req": "true"}
+        self.headers = DEFAULT_HEADERS
+        self._request_semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        self._session_lock = asyncio.Lock()
+        self._cache: Dict[tuple, Tuple[float, List[Dict[str, str]]]] = {}
+        self._inflight: Dict[tuple, asyncio.Future] = {}
 
     async def _get_session(self):
-        if not self.session:
-            self.session = httpx.AsyncClient(headers=self.headers, timeout=30.0)
+        if self.session is None or self.session.is_closed:
+            self.session = get_shared_client()
+            self.session_initialized = False
         if not self.session_initialized:
-            await self._initialize_session(self.session)
+            # One warm-up GET even when many callers arrive together
+            async with self._session_lock:
+                await self._initialize_session(self.session)
         return self.session
 
     async def _initialize_session(self, session: httpx.AsyncClient) -> None:
@@ -38,179 +198,243 @@ class ECourtsScraper:
             return
         init_url = f"{self.base_url}{self._init_path}"
         try:
-            response = await session.get(init_url)
+            response = await self._request(session, "GET", init_url)
             response.raise_for_status()
-            self._capture_app_token_from_html(response.text)
+            self._capture_app_token(self._parse_html_response(response))
             self.session_initialized = True
         except Exception as exc:
             print(f"[WARN] Unable to warm up eCourts session via {init_url}: {exc}")
 
-    def _capture_app_token_from_html(self, html_content: str) -> None:
-        if self.app_token:
+    async def _request(
+        self,
+        session: httpx.AsyncClient,
+        method: str,
+        url: str,
+        *,
+        idempotent: bool = True,
+        stream: bool = False,
+        **kwargs
+    ) -> httpx.Response:
+        """Send a request, retrying transport failures with exponential backoff.
+
+        Non-idempotent requests are only retried if they never reached the server.
+        With stream=True the body is left unread and the caller must aclose() it.
+        """
+        retry_on = _RETRYABLE_ERRORS if idempotent else _PRE_SEND_ERRORS
+        read_timeouts = 0
+        for attempt in range(REQUEST_ATTEMPTS):
+            try:
+                if stream:
+                    return await session.send(session.build_request(method, url, **kwargs), stream=True)
+                return await session.request(method, url, **kwargs)
+            except retry_on as exc:
+                if isinstance(exc, httpx.ReadTimeout):
+                    read_timeouts += 1
+                if attempt == REQUEST_ATTEMPTS - 1 or read_timeouts >= READ_TIMEOUT_ATTEMPTS:
+                    raise
+                delay = min(RETRY_BACKOFF_BASE * (2 ** attempt), RETRY_BACKOFF_MAX)
+                print(f"[WARN] {method} {url} failed ({exc!r}); retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+
+    def _parse_html_response(self, response: httpx.Response) -> Optional[etree._Element]:
+        """Parse an HTML response body straight from bytes"""
+        if not response.content:
+            return None
+        return etree.fromstring(response.content, _html_parser(response.encoding or "utf-8"))
+
+    def _capture_app_token(self, root: Optional[etree._Element]) -> None:
+        if self.app_token or root is None:
             return
-        try:
-            soup = BeautifulSoup(html_content, 'html.parser')
-            token_input = soup.find('input', {'id': 'app_token'})
-            if token_input:
-                token = token_input.get('value', '').strip()
-                if token:
-                    self.app_token = token
-        except Exception as exc:
-            print(f"[WARN] Failed to capture app_token from HTML: {exc}")
+        token_input = root.find('.//input[@id="app_token"]')
+        if token_input is not None:
+            token = (token_input.get('value') or '').strip()
+            if token:
+                self._set_app_token(token)
+
+    def _get_cached(self, key: tuple) -> Optional[List[Dict[str, str]]]:
+        entry = self._cache.get(key)
+        if entry and entry[0] > time.monotonic():
+            return entry[1]
+        return None
+
+    def _set_cached(self, key: tuple, value: List[Dict[str, str]]) -> None:
+        if value:
+            self._cache[key] = (time.monotonic() + DROPDOWN_CACHE_TTL, value)
+
+    def _set_app_token(self, token: str) -> None:
+        self.app_token = token
+        self._base_form["app_token"] = token
 
     def _prepare_form_data(self, payload: Dict[str, Any]) -> Dict[str, Any]:
-        data: Dict[str, Any] = {"ajax_req": "true"}
-        if self.app_token:
-            data["app_token"] = self.app_token
-        data.update(payload)
-        return {key: str(value) for key, value in data.items() if value is not None}
-
-    def _extract_complex_parts(self, complex_code: str) -> Dict[str, Any]:
-        parts = complex_code.split('@') if complex_code else []
-        complex_id = parts[0] if parts else complex_code
-        est_codes = []
-        flag = None
-
-        if len(parts) > 1:
-            est_codes = [code.strip() for code in parts[1].split(',') if code.strip()]
-        if len(parts) > 2:
-            flag = parts[2].strip()
+        data = self._base_form | payload
+        for key, value in payload.items():
+            if value is None:
+                del data[key]
+            elif not isinstance(value, str):
+                data[key] = str(value)
+        return data
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _extract_complex_parts(complex_code: str) -> Dict[str, Any]:
+        """Split "<id>@<est,codes>@<flag>" into its parts (cached; treat the result as read-only)"""
+        if not complex_code:
+            return {"id": complex_code, "est_codes": (), "flag": None}
+
+        complex_id, est_part, flag = _COMPLEX_RE.match(complex_code).groups()
+        est_codes = tuple(code.strip() for code in est_part.split(',') if code.strip()) if est_part else ()
 
         return {
             "id": complex_id,
             "est_codes": est_codes,
-            "flag": flag
+            "flag": flag.strip() if flag is not None else None
         }
 
-    def _parse_json_payload(self, response_text: str) -> Dict[str, Any]:
-        text = response_text.strip()
-        if not text:
+    def _parse_option_list(self, options_html: str, court_numbers: bool = False) -> List[Dict[str, str]]:
+        """Return code/name pairs for the selectable <option>s in a dropdown fragment"""
+        if not options_html:
+            return []
+
+        # eCourts emits flat <option value="..">text</option> lists; only build
+        # a tree when some option does not fit that shape.
+        matches = _OPTION_RE.findall(options_html)
+        if len(matches) == len(_OPTION_TAG_RE.findall(options_html)):
+            keep = _is_court_option if court_numbers else _is_selectable_option
+            options = []
+            for value, text in matches:
+                value = html.unescape(value).strip()
+                text = html.unescape(text).strip()
+                if keep(value, text):
+                    options.append({"code": value, "name": text})
+            return options
+
+        root = etree.HTML(options_html)
+        if root is None:
+            return []
+        xpath = _COURT_OPTION_XPATH if court_numbers else _OPTION_XPATH
+        return self._options_to_list(xpath(root))
+
+    def _options_to_list(self, options: List[etree._Element]) -> List[Dict[str, str]]:
+        return [
+            {"code": option.get('value').strip(), "name": ''.join(option.itertext()).strip()}
+            for option in options
+        ]
+
+    def _parse_json_payload(self, response: httpx.Response) -> Dict[str, Any]:
+        content = response.content
+        match = _NON_WHITESPACE.search(content)
+        if not match:
             return {}
-        candidate = text
-        if not text.startswith("{"):
-            start_index = text.find('{"')
+        start_index = match.start()
+        if content[start_index] != ord("{"):
+            start_index = content.find(b'{"', start_index)
             if start_index == -1:
                 return {}
-            candidate = text[start_index:]
+        candidate = memoryview(content)[start_index:] if start_index else content
+        try:
+            return orjson.loads(candidate)
+        except orjson.JSONDecodeError:
+            pass
+        import json  # rare fallback; keep it off the import path
         try:
-            return json.loads(candidate)
-        except json.JSONDecodeError as exc:
+            return json.loads(bytes(candidate))
+        except (json.JSONDecodeError, UnicodeDecodeError) as exc:
             print(f"[WARN] Failed to decode JSON payload: {exc}")
             return {}
 
     def _update_app_token(self, payload: Dict[str, Any]) -> None:
         token = payload.get("app_token")
-        if token:
-            self.app_token = token
+        if token and token != self.app_token:
+            self._set_app_token(token)
+
+    async def _coalesce(self, key: tuple, coro_factory: Callable[[], Awaitable[Any]]) -> Any:
+        """Share a single in-flight fetch between concurrent callers asking for the same key"""
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(coro_factory())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(task)
+
+    async def _cached_fetch(self, key: tuple, fetch: Callable[[], Awaitable[List[Dict[str, str]]]]) -> List[Dict[str, str]]:
+        cached = self._get_cached(key)
+        if cached is not None:
+            return cached
+
+        async def fetch_and_cache():
+            result = await fetch()
+            self._set_cached(key, result)
+            return result
 
-    async def fetch_states(self) -> List[Dict[str, str]]:
+        return await self._coalesce(key, fetch_and_cache)
+
+    async def fetch_states(self) -> Sequence[Dict[str, str]]:
         """Fetch list of all states from eCourts"""
+        states = await self._cached_fetch(("states",), self._fetch_states)
+        return states or self._get_default_states()
+
+    async def _fetch_states(self) -> List[Dict[str, str]]:
         try:
             session = await self._get_session()
 
             url = f"{self.base_url}/?p=cause_list/"
-            response = await session.get(url)
+            response = await self._request(session, "GET", url)
 
-            soup = BeautifulSoup(response.text, 'html.parser')
-            self._capture_app_token_from_html(response.text)
+            root = self._parse_html_response(response)
+            self._capture_app_token(root)
 
             states = []
-            state_select = (
-                soup.find('select', {'id': 'sess_state_code'})
-                or soup.find('select', {'id': 'state_code'})
-                or soup.find('select', {'name': 'state_code'})
-            )
-
-            if state_select:
-                for option in state_select.find_all('option'):
-                    value = option.get('value', '').strip()
-                    text = option.text.strip()
-                    if value and value != '0':
-                        states.append({
-                            "code": value,
-                            "name": text
-                        })
-
-            if not states:
-                states = self._get_default_states()
+            for path in _STATE_SELECT_PATHS:
+                state_select = root.find(path) if root is not None else None
+                if state_select is not None:
+                    states = self._options_to_list(_OPTION_XPATH(state_select))
+                    break
 
             return states
         except Exception as e:
             print(f"Error fetching states: {e}")
-            return self._get_default_states()
+            return []
 
-    def _get_default_states(self) -> List[Dict[str, str]]:
-        """Fallback list of Indian states"""
-        return [
-            {"code": "28", "name": "Andaman and Nicobar"},
-            {"code": "2", "name": "Andhra Pradesh"},
-            {"code": "36", "name": "Arunachal Pradesh"},
-            {"code": "6", "name": "Assam"},
-            {"code": "8", "name": "Bihar"},
-            {"code": "27", "name": "Chandigarh"},
-            {"code": "18", "name": "Chhattisgarh"},
-            {"code": "26", "name": "Delhi"},
-            {"code": "30", "name": "Goa"},
-            {"code": "17", "name": "Gujarat"},
-            {"code": "14", "name": "Haryana"},
-            {"code": "5", "name": "Himachal Pradesh"},
-            {"code": "12", "name": "Jammu and Kashmir"},
-            {"code": "7", "name": "Jharkhand"},
-            {"code": "3", "name": "Karnataka"},
-            {"code": "4", "name": "Kerala"},
-            {"code": "33", "name": "Ladakh"},
-            {"code": "37", "name": "Lakshadweep"},
-            {"code": "23", "name": "Madhya Pradesh"},
-            {"code": "1", "name": "Maharashtra"},
-            {"code": "25", "name": "Manipur"},
-            {"code": "21", "name": "Meghalaya"},
-            {"code": "19", "name": "Mizoram"},
-            {"code": "34", "name": "Nagaland"},
-            {"code": "11", "name": "Odisha"},
-            {"code": "35", "name": "Puducherry"},
-            {"code": "22", "name": "Punjab"},
-            {"code": "9", "name": "Rajasthan"},
-            {"code": "24", "name": "Sikkim"},
-            {"code": "10", "name": "Tamil Nadu"},
-            {"code": "29", "name": "Telangana"},
-            {"code": "38", "name": "The Dadra And Nagar Haveli And Daman And Diu"},
-            {"code": "20", "name": "Tripura"},
-            {"code": "15", "name": "Uttarakhand"},
-            {"code": "13", "name": "Uttar Pradesh"},
-            {"code": "16", "name": "West Bengal"}
-        ]
+    def _get_default_states(self) -> Sequence[Dict[str, str]]:
+        """Fallback list of Indian states (shared constant, do not mutate)"""
+        return _DEFAULT_STATES
+
+    @staticmethod
+    def is_default_states(states: Sequence[Dict[str, str]]) -> bool:
+        """True if fetch_states fell back to the built-in list instead of scraping"""
+        return states is _DEFAULT_STATES
 
     async def fetch_districts(self, state_code: str) -> List[Dict[str, str]]:
         """Fetch districts for a given state"""
+        return await self._cached_fetch(
+            ("districts", state_code),
+            lambda: self._fetch_districts(state_code)
+        )
+
+    async def _fetch_districts(self, state_code: str) -> List[Dict[str, str]]:
         try:
             session = await self._get_session()
 
             url = f"{self.base_url}/?p=casestatus/fillDistrict"
             data = self._prepare_form_data({"state_code": state_code})
-            response = await session.post(url, data=data)
+            response = await self._request(session, "POST", url, data=data)
 
-            payload = self._parse_json_payload(response.text)
+            payload = self._parse_json_payload(response)
             self._update_app_token(payload)
 
-            districts = []
-            options_html = payload.get("dist_list", "")
-            soup = BeautifulSoup(options_html, 'html.parser')
-
-            for option in soup.find_all('option'):
-                value = option.get('value', '').strip()
-                text = option.text.strip()
-                if value and value != '0':
-                    districts.append({
-                        "code": value,
-                        "name": text
-                    })
-            return districts
+            return self._parse_option_list(payload.get("dist_list", ""))
         except Exception as e:
             print(f"[ERROR] Error fetching districts for state {state_code}: {e}")
             return []
 
     async def fetch_court_complexes(self, state_code: str, district_code: str) -> List[Dict[str, str]]:
         """Fetch court complexes for a given state and district"""
+        return await self._cached_fetch(
+            ("court_complexes", state_code, district_code),
+            lambda: self._fetch_court_complexes(state_code, district_code)
+        )
+
+    async def _fetch_court_complexes(self, state_code: str, district_code: str) -> List[Dict[str, str]]:
         try:
             session = await self._get_session()
 
@@ -219,25 +443,12 @@ class ECourtsScraper:
                 "state_code": state_code,
                 "dist_code": district_code
             })
-            response = await session.post(url, data=data)
+            response = await self._request(session, "POST", url, data=data)
 
-            payload = self._parse_json_payload(response.text)
+            payload = self._parse_json_payload(response)
             self._update_app_token(payload)
 
-            complexes = []
-            options_html = payload.get("complex_list", "")
-            soup = BeautifulSoup(options_html, 'html.parser')
-
-            for option in soup.find_all('option'):
-                value = option.get('value', '').strip()
-                text = option.text.strip()
-                if value and value != '0':
-                    complexes.append({
-                        "code": value,
-                        "name": text
-                    })
-
-            return complexes
+            return self._parse_option_list(payload.get("complex_list", ""))
         except Exception as e:
             print(f"Error fetching court complexes: {e}")
             return []
@@ -254,49 +465,42 @@ class ECourtsScraper:
         })
 
         url = f"{self.base_url}/?p=courtorder/fillCourtNumber"
-        response = await session.post(url, data=data)
+        async with self._request_semaphore:
+            response = await self._request(session, "POST", url, data=data)
 
-        payload = self._parse_json_payload(response.text)
+        payload = self._parse_json_payload(response)
         self._update_app_token(payload)
 
-        courts: List[Dict[str, str]] = []
-        options_html = payload.get("courtnumber_list", "")
-        soup = BeautifulSoup(options_html, 'html.parser')
-
-        for option in soup.find_all('option'):
-            value = option.get('value', '').strip()
-            text = option.text.strip()
-            if not value or value.upper() == 'D' or 'Select Court' in text:
-                continue
-            courts.append({
-                "code": value,
-                "name": text
-            })
-
-        return courts
+        return self._parse_option_list(payload.get("courtnumber_list", ""), court_numbers=True)
 
     async def fetch_courts(self, state_code: str, district_code: str, complex_code: str) -> List[Dict[str, str]]:
         """Fetch individual courts for a given court complex"""
+        return await self._cached_fetch(
+            ("courts", state_code, district_code, complex_code),
+            lambda: self._fetch_courts(state_code, district_code, complex_code)
+        )
+
+    async def _fetch_courts(self, state_code: str, district_code: str, complex_code: str) -> List[Dict[str, str]]:
         try:
             session = await self._get_session()
 
             complex_parts = self._extract_complex_parts(complex_code)
             est_codes = complex_parts["est_codes"] or [None]
 
+            # Sequential on purpose: each reply rotates app_token, and the next
+            # request must carry the token from the previous reply.
             courts: List[Dict[str, str]] = []
             for est_code in est_codes:
                 try:
-                    courts.extend(
-                        await self._fetch_court_numbers(
-                            session,
-                            state_code,
-                            district_code,
-                            complex_code,
-                            est_code
-                        )
-                    )
-                except Exception as inner_exc:
-                    print(f"[WARN] Failed to fetch court numbers for establishment {est_code}: {inner_exc}")
+                    courts.extend(await self._fetch_court_numbers(
+                        session,
+                        state_code,
+                        district_code,
+                        complex_code,
+                        est_code
+                    ))
+                except Exception as exc:
+                    print(f"[WARN] Failed to fetch court numbers for establishment {est_code}: {exc}")
 
             # Deduplicate while preserving order
             unique_courts: Dict[str, Dict[str, str]] = {}
@@ -321,9 +525,9 @@ class ECourtsScraper:
             if district_code:
                 data["dist_code"] = district_code
 
-            response = await session.post(url, data=data)
+            response = await self._request(session, "POST", url, data=data)
 
-            result = self._parse_case_result(response.text, cnr)
+            result = self._parse_case_result(self._parse_html_response(response), cnr)
             result["search_type"] = "CNR"
             result["cnr"] = cnr
 
@@ -355,9 +559,9 @@ class ECourtsScraper:
                 "case_year": case_year
             }
 
-            response = await session.post(url, data=data)
+            response = await self._request(session, "POST", url, data=data)
 
-            result = self._parse_case_result(response.text, f"{case_type}/{case_number}/{case_year}")
+            result = self._parse_case_result(self._parse_html_response(response), f"{case_type}/{case_number}/{case_year}")
             result["search_type"] = "DETAILS"
             result["case_details"] = {
                 "case_type": case_type,
@@ -370,9 +574,8 @@ class ECourtsScraper:
             print(f"Error searching case by details: {e}")
             return None
 
-    def _parse_case_result(self, html_content: str, case_id: str) -> Dict:
+    def _parse_case_result(self, root: Optional[etree._Element], case_id: str) -> Dict:
         """Parse case search result HTML"""
-        soup = BeautifulSoup(html_content, 'html.parser')
 
         result = {
             "case_id": case_id,
@@ -389,27 +592,24 @@ class ECourtsScraper:
         today = datetime.now().date()
         tomorrow = today + timedelta(days=1)
 
-        rows = soup.find_all('tr')
+        rows = root.iter('tr') if root is not None else ()
         for row in rows:
-            cells = row.find_all('td')
+            cells = list(islice(row.iterfind('.//td'), 2))
             if len(cells) >= 2:
-                label = cells[0].text.strip().lower()
-                value = cells[1].text.strip()
+                label = ''.join(cells[0].itertext()).strip().lower()
+                value = ''.join(cells[1].itertext()).strip()
 
                 result["details"][label] = value
 
                 if 'hearing date' in label or 'next date' in label:
                     result["next_hearing_date"] = value
-                    try:
-                        hearing_date = datetime.strptime(value, "%d-%m-%Y").date()
-                        if hearing_date == today:
-                            result["listed_today"] = True
-                            result["found"] = True
-                        elif hearing_date == tomorrow:
-                            result["listed_tomorrow"] = True
-                            result["found"] = True
-                    except:
-                        pass
+                    hearing_date = _parse_dmy_date(value)
+                    if hearing_date == today:
+                        result["listed_today"] = True
+                        result["found"] = True
+                    elif hearing_date == tomorrow:
+                        result["listed_tomorrow"] = True
+                        result["found"] = True
 
                 if 'court' in label:
                     result["court_name"] = value
@@ -427,9 +627,11 @@ class ECourtsScraper:
         try:
             session = await self._get_session()
             url = f"{self.base_url}/?p=casestatus/getCaptcha"
-            response = await session.post(url, data=self._prepare_form_data({}), timeout=None)
+            response = await self._request(
+                session, "POST", url, data=self._prepare_form_data({}), timeout=None, idempotent=False
+            )
 
-            payload = self._parse_json_payload(response.text)
+            payload = self._parse_json_payload(response)
             if not payload:
                 return None
 
@@ -439,9 +641,13 @@ class ECourtsScraper:
             if not div_html:
                 return None
 
-            soup = BeautifulSoup(div_html, 'html.parser')
-            img_tag = soup.find('img', {'id': 'captcha_image'}) or soup.find('img')
-            if not img_tag:
+            root = etree.HTML(div_html)
+            if root is None:
+                return None
+            img_tag = root.find('.//img[@id="captcha_image"]')
+            if img_tag is None:
+                img_tag = root.find('.//img')
+            if img_tag is None:
                 return None
 
             img_src = img_tag.get('src', '')
@@ -450,18 +656,19 @@ class ECourtsScraper:
 
             root_base = self.base_url.split('/ecourtindia_v6')[0] or self.base_url
             img_url = urljoin(f"{root_base}/", img_src.lstrip('/'))
-            img_response = await session.get(img_url)
-            img_response.raise_for_status()
-
-            image_data = base64.b64encode(img_response.content).decode('utf-8')
 
             audio_link = None
-            audio_anchor = soup.find('a', {'class': 'captcha_play_button'})
-            if audio_anchor:
-                href = audio_anchor.get('href')
+            audio_anchors = _CAPTCHA_AUDIO_XPATH(root)
+            if audio_anchors:
+                href = audio_anchors[0].get('href')
                 if href:
                     audio_link = urljoin(f"{root_base}/", href.lstrip('/'))
 
+            img_response = await self._request(session, "GET", img_url)
+            img_response.raise_for_status()
+
+            image_data = base64.b64encode(img_response.content).decode('ascii')
+
             return {
                 "image": f"data:image/png;base64,{image_data}",
                 "audio": audio_link
@@ -511,13 +718,13 @@ class ECourtsScraper:
                 if len(pieces[0]) == 4:
                     formatted_date = f"{pieces[2]}-{pieces[1]}-{pieces[0]}"
 
+            now = datetime.now()
             try:
                 selected_date = datetime.strptime(formatted_date, "%d-%m-%Y")
             except ValueError:
-                selected_date = datetime.now()
+                selected_date = now
 
-            today = datetime.now()
-            days_difference = (today.date() - selected_date.date()).days
+            days_difference = (now.date() - selected_date.date()).days
             selprevdays = "1" if days_difference >= 1 else "0"
 
             est_code = ""
@@ -539,9 +746,11 @@ class ECourtsScraper:
             }
 
             url = f"{self.base_url}/?p=cause_list/submitCauseList"
-            response = await session.post(url, data=self._prepare_form_data(payload_data))
+            response = await self._request(
+                session, "POST", url, data=self._prepare_form_data(payload_data), idempotent=False
+            )
 
-            payload = self._parse_json_payload(response.text)
+            payload = self._parse_json_payload(response)
             self._update_app_token(payload)
 
             metadata = {
@@ -552,14 +761,14 @@ class ECourtsScraper:
                 "date": formatted_date,
                 "cause_type": cause_type,
                 "court_name": court_name,
-                "fetched_at": datetime.now().isoformat()
+                "fetched_at": now.isoformat()
             }
 
             if not payload:
                 raw_content = response.content[:200]
                 snippet = response.text[:200]
                 print(f"[WARN] Cause list response not in JSON format. Status={response.status_code} TextLen={len(response.text)} ContentLen={len(response.content)} Snippet repr={repr(snippet)} Raw repr={repr(raw_content)} Headers={dict(response.headers)}")
-                self._capture_app_token_from_html(response.text)
+                self._capture_app_token(self._parse_html_response(response))
                 return {
                     "error": "Unable to process cause list response.",
                     "cases": [],
@@ -572,7 +781,8 @@ class ECourtsScraper:
             if status != 1:
                 err_html = payload.get("errormsg") or payload.get("message")
                 if err_html:
-                    err_text = BeautifulSoup(err_html, 'html.parser').get_text().strip()
+                    err_root = etree.HTML(err_html)
+                    err_text = "".join(err_root.itertext()).strip() if err_root is not None else ""
                     if err_text:
                         error_messages.append(err_text)
                 # when status not 1, still return any partial metadata
@@ -604,23 +814,21 @@ class ECourtsScraper:
 
     def _parse_cause_list(self, html_content: str) -> Dict:
         """Parse cause list HTML"""
-        soup = BeautifulSoup(html_content, 'html.parser')
-
         cases = []
-        table = soup.find('table')
+        root = etree.HTML(html_content) if html_content else None
 
-        if table:
-            rows = table.find_all('tr')[1:]
+        if root is not None:
+            rows = _CAUSE_LIST_ROWS(root)[1:]
 
             for row in rows:
-                cells = row.find_all('td')
+                cells = [''.join(cell.itertext()).strip() for cell in row.iterfind('.//td')]
                 if len(cells) >= 4:
                     case = {
-                        "serial_number": cells[0].text.strip(),
-                        "case_number": cells[1].text.strip(),
-                        "parties": cells[2].text.strip(),
-                        "advocate": cells[3].text.strip() if len(cells) > 3 else "",
-                        "purpose": cells[4].text.strip() if len(cells) > 4 else ""
+                        "serial_number": cells[0],
+                        "case_number": cells[1],
+                        "parties": cells[2],
+                        "advocate": cells[3],
+                        "purpose": cells[4] if len(cells) > 4 else ""
                     }
                     cases.append(case)
 
@@ -661,20 +869,28 @@ class ECourtsScraper:
             if court_code:
                 data["court_code"] = court_code
 
-            response = await session.post(url, data=data)
+            response = await self._request(session, "POST", url, data=data, stream=True)
+            try:
+                if response.status_code != 200 or response.headers.get('content-type') != 'application/pdf':
+                    return None
 
-            if response.status_code == 200 and response.headers.get('content-type') == 'application/pdf':
                 os.makedirs('downloads', exist_ok=True)
 
                 filename = f"cause_list_{state_code}_{district_code}_{complex_id}_{formatted_date.replace('-', '')}.pdf"
                 filepath = os.path.join('downloads', filename)
 
-                with open(filepath, 'wb') as f:
-                    f.write(response.content)
-
-                return filepath
-
-            return None
+                try:
+                    async with aiofiles.open(filepath, 'wb') as f:
+                        async for chunk in response.aiter_bytes(PDF_CHUNK_SIZE):
+                            await f.write(chunk)
+                except Exception:
+                    if os.path.exists(filepath):
+                        os.remove(filepath)
+                    raise
+            finally:
+                await response.aclose()
+
+            return filepath
         except Exception as e:
             print(f"Error downloading PDF: {e}")
             return None
@@ -0,0 +1,78 @@
+/*
+  # Store cause list cases as individual rows
+
+  1. New Tables
+    - `cause_list_cases`
+      - `cause_list_id` (uuid, foreign key) - Reference to cause_lists
+      - `position` (integer) - Row order within the cause list
+      - `serial_number` (text)
+      - `case_number` (text)
+      - `parties` (text)
+      - `advocate` (text)
+      - `purpose` (text)
+
+  2. Data Migration
+    - Copy every case already stored in `cause_lists.cases` into `cause_list_cases`
+      (older rows hold the array as a JSON-encoded string scalar)
+
+  3. Modified Tables
+    - `cause_lists`
+      - Drop `cases` (jsonb) - Now stored in `cause_list_cases`
+      - Drop `full_data` (jsonb) - Duplicated `cases` plus columns already on the row
+
+  4. Security
+    - Enable RLS on `cause_list_cases`
+    - Add policy for public read access
+*/
+
+CREATE TABLE IF NOT EXISTS cause_list_cases (
+  cause_list_id uuid NOT NULL REFERENCES cause_lists(id) ON DELETE CASCADE,
+  position integer NOT NULL,
+  serial_number text,
+  case_number text,
+  parties text,
+  advocate text,
+  purpose text,
+  PRIMARY KEY (cause_list_id, position)
+);
+
+DO $$
+BEGIN
+  IF EXISTS (
+    SELECT 1 FROM information_schema.columns
+    WHERE table_schema = 'public' AND table_name = 'cause_lists' AND column_name = 'cases'
+  ) THEN
+    INSERT INTO cause_list_cases (cause_list_id, position, serial_number, case_number, parties, advocate, purpose)
+    SELECT
+      cl.id,
+      c.ordinality - 1,
+      c.value->>'serial_number',
+      c.value->>'case_number',
+      c.value->>'parties',
+      c.value->>'advocate',
+      c.value->>'purpose'
+    FROM cause_lists cl
+    CROSS JOIN LATERAL (
+      SELECT CASE jsonb_typeof(cl.cases)
+        WHEN 'string' THEN (cl.cases #>> '{}')::jsonb
+        ELSE cl.cases
+      END AS cases
+    ) parsed
+    CROSS JOIN LATERAL jsonb_array_elements(
+      CASE WHEN jsonb_typeof(parsed.cases) = 'array' THEN parsed.cases ELSE '[]'::jsonb END
+    ) WITH ORDINALITY AS c(value, ordinality)
+    ON CONFLICT (cause_list_id, position) DO NOTHING;
+  END IF;
+END $$;
+
+ALTER TABLE cause_lists DROP COLUMN IF EXISTS cases;
+ALTER TABLE cause_lists DROP COLUMN IF EXISTS full_data;
+
+ALTER TABLE cause_list_cases ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY "Public read access to cause list cases"
+  ON cause_list_cases FOR SELECT
+  TO anon, authenticated
+  USING (true);
+
+CREATE INDEX IF NOT EXISTS idx_cause_list_cases_serial ON cause_list_cases(cause_list_id, serial_number);
@@ -0,0 +1,46 @@
+/*
+  # Derive search result case details from full_result
+
+  1. Data Migration
+    - Decode `full_result` values stored as JSON-encoded string scalars
+    - Copy `case_details` into `full_result` wherever it is missing there
+
+  2. Modified Tables
+    - `search_results`
+      - Drop `case_details` (jsonb) - Always a copy of `full_result->'case_details'`
+
+  3. New Views
+    - `search_results_v`
+      - All `search_results` columns plus `case_details` projected from `full_result`
+      - Runs with the caller's permissions so the table's RLS policies apply
+*/
+
+UPDATE search_results
+  SET full_result = (full_result #>> '{}')::jsonb
+  WHERE jsonb_typeof(full_result) = 'string';
+
+DO $$
+BEGIN
+  IF EXISTS (
+    SELECT 1 FROM information_schema.columns
+    WHERE table_schema = 'public' AND table_name = 'search_results' AND column_name = 'case_details'
+  ) THEN
+    UPDATE search_results
+      SET full_result = jsonb_set(full_result, '{case_details}', case_details)
+      WHERE jsonb_typeof(full_result) = 'object'
+        AND NOT full_result ? 'case_details'
+        AND case_details IS NOT NULL;
+  END IF;
+END $$;
+
+ALTER TABLE search_results DROP COLUMN IF EXISTS case_details;
+
+CREATE OR REPLACE VIEW search_results_v
+  WITH (security_invoker = true)
+  AS
+  SELECT
+    *,
+    COALESCE(full_result->'case_details', '{}'::jsonb) AS case_details
+  FROM search_results;
+
+GRANT SELECT ON search_results_v TO anon, authenticated;